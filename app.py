@@ -1,24 +1,54 @@
 # app.py
-from fastapi import FastAPI, Query, Depends
+from contextlib import asynccontextmanager
+import aiohttp
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import StreamingResponse
+import numpy as np
+import orjson
 from pydantic import BaseModel
-from typing import Literal
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Iterator, List, Literal
+from sqlalchemy import insert
+from batcher import AsyncBatcher
 from db import SessionLocal, AddressQuery
 
 from eth_stats import compute_address_stats
 
-app = FastAPI(title="ETH Tx Stats (fixed EUR)")
+class QueryLogBatcher(AsyncBatcher[str]):
+    """Writes AddressQuery rows in multi-row INSERTs instead of one commit per request."""
+
+    async def process_batch(self, items: List[str]) -> None:
+        async with SessionLocal() as session:
+            await session.execute(insert(AddressQuery), [{"address": a} for a in items])
+            await session.commit()
+
+query_log = QueryLogBatcher(max_batch_size=100, max_queue_time=0.5)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled client for the whole process keeps Etherscan TCP/TLS connections alive between requests.
+    app.state.http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60))
+    query_log.start()
+    yield
+    await query_log.stop()
+    await app.state.http.close()
+
+app = FastAPI(title="ETH Tx Stats (fixed EUR)", lifespan=lifespan)
 
 class StatsResponse(BaseModel):
     stablecoins: dict
 
-async def get_session() -> AsyncSession:
-    async with SessionLocal() as session:
-        yield session
+NDJSON_CHUNK = 4096
+
+def _ndjson_lines(summary: dict, amounts: np.ndarray) -> Iterator[bytes]:
+    """Stats summary as the first line, then one ETH amount per line, emitted in chunks."""
+    yield orjson.dumps(summary) + b"\n"
+    for i in range(0, len(amounts), NDJSON_CHUNK):
+        yield ("\n".join(map(repr, amounts[i:i + NDJSON_CHUNK].tolist())) + "\n").encode()
 
 @app.get("/address/{address}", response_model=StatsResponse)
 async def get_stats(
     address: str,
+    request: Request,
     include_internal: bool = Query(False),
     include_tokens: bool = Query(True),
     exclude_zero_eth: bool = Query(False),
@@ -26,12 +56,11 @@ async def get_stats(
     startblock: int = Query(0, ge=0),
     endblock: int = Query(99_999_999, ge=0),
     sort: Literal["asc", "desc"] = Query("asc"),
-    session: AsyncSession = Depends(get_session),
+    raw: bool = Query(False, description="Stream per-tx ETH amounts as NDJSON after the summary line"),
 ):
-    session.add(AddressQuery(address=address))
-    await session.commit()
+    query_log.submit(address)
 
-    result = compute_address_stats(
+    result = await compute_address_stats(
         address,
         include_internal=include_internal,
         include_tokens=include_tokens,
@@ -40,5 +69,11 @@ async def get_stats(
         startblock=startblock,
         endblock=endblock,
         sort=sort,
+        raw_eth_amounts=raw,
+        http=request.app.state.http,
     )
+    if raw:
+        summary = StatsResponse.model_validate(result).model_dump()
+        return StreamingResponse(_ndjson_lines(summary, result["eth"]["raw_eth_amounts"]),
+                                 media_type="application/x-ndjson")
     return result
@@ -0,0 +1,71 @@
+# batcher.py
+import asyncio
+import logging
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+class AsyncBatcher(Generic[T]):
+    """
+    Collects items submitted from request handlers and hands them to `process_batch`
+    in groups of up to `max_batch_size`, waiting at most `max_queue_time` seconds
+    after the first item of a group. Subclasses implement `process_batch`.
+    """
+
+    def __init__(self, max_batch_size: int = 100, max_queue_time: float = 0.5):
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def process_batch(self, items: List[T]) -> None:
+        raise NotImplementedError
+
+    def start(self) -> None:
+        if self._task is None:
+            # Created here rather than in __init__ so the queue belongs to the loop that runs the consumer
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush whatever is queued, then stop the consumer."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(_STOP)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    def submit(self, item: T) -> None:
+        """Fire-and-forget: never blocks the caller. Must be called after `start()`."""
+        self._queue.put_nowait(item)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = loop.time() + self.max_queue_time
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                await self.process_batch(batch)
+            except Exception:
+                logger.exception("%s dropped a batch of %d items", type(self).__name__, len(batch))
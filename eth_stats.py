@@ -1,11 +1,22 @@
 # eth_stats.py
+import asyncio
+import hashlib
 import os
 import time
-from typing import List, Dict, Sequence, Tuple, Optional, Literal
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Dict, Sequence, Tuple, Optional, Literal
 
-import requests
+import aiohttp
+import numpy as np
+import orjson
+from asyncio_throttle import Throttler
 from dotenv import load_dotenv
 
+import tx_store
+from db import SessionLocal
+
 load_dotenv()
 
 API_URL = os.getenv("API_URL", "https://api.etherscan.io/api")
@@ -20,6 +31,13 @@ STABLE_TOKENS: Dict[str, int] = {
     "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48": 6,  # USDC
     "0xdac17f958d2ee523a2206206994597c13d831ec7": 6,  # USDT
 }
+# Per-contract raw-unit -> USD divisor, matched against whole arrays of contract addresses.
+# Dividing by the exact power of ten keeps round amounts round (5 USDC -> 4.25 EUR).
+_STABLE_DIVISORS: Dict[str, float] = {c: float(10 ** d) for c, d in STABLE_TOKENS.items()}
+
+# Conversion factors folded once, so the vectorized path does one multiply per output array
+_WEI_TO_ETH = 1e-18
+_WEI_TO_EUR = FIXED_ETH_EUR_RATE * _WEI_TO_ETH
 
 # ===== Fixed-rate converters =====
 def eth_to_eur(value_eth: float) -> float:
@@ -35,85 +53,244 @@ def wei_to_eth(wei_str: str) -> float:
 def to_float_amount(raw: str, decimals: int) -> float:
     return int(raw) / (10 ** decimals)
 
-def _median_with_indices(values: Sequence[float]) -> Tuple[float, List[int]]:
+def parse_raw_amounts(raws: Sequence[str]) -> np.ndarray:
+    """
+    Decimal integer strings (wei, token base units) -> float64 array.
+    NumPy parses the whole list as uint64 in C; only if some value exceeds 2**64
+    (~18.4 ETH in wei) does it fall back to Python ints.
+    """
+    try:
+        return np.array(raws, dtype=np.uint64).astype(np.float64)
+    except OverflowError:
+        return np.fromiter((int(r) for r in raws), dtype=np.float64, count=len(raws))
+
+def _index_at_rank(values: np.ndarray, k: int, v: float) -> int:
+    """
+    Index of the k-th smallest element, given its value `v`, in the same position a stable
+    sort would put it: ties at `v` are taken in original order.
+    """
+    return int(np.flatnonzero(values == v)[k - np.count_nonzero(values < v)])
+
+def _median_with_indices(values: np.ndarray) -> Tuple[float, List[int]]:
     n = len(values)
-    ord_idx = sorted(range(n), key=lambda i: values[i])
     if n % 2 == 1:
-        mid = ord_idx[n // 2]
-        return values[mid], [mid]
+        k = n // 2
+        v = np.partition(values, k)[k]
+        return float(v), [_index_at_rank(values, k, v)]
     else:
-        lo = ord_idx[n // 2 - 1]
-        hi = ord_idx[n // 2]
-        return (values[lo] + values[hi]) / 2.0, [lo, hi]
+        k_lo, k_hi = n // 2 - 1, n // 2
+        part = np.partition(values, [k_lo, k_hi])
+        v_lo, v_hi = part[k_lo], part[k_hi]
+        lo = _index_at_rank(values, k_lo, v_lo)
+        hi = _index_at_rank(values, k_hi, v_hi)
+        return (float(v_lo) + float(v_hi)) / 2.0, [lo, hi]
 
 def stats_with_hash(values: Sequence[float], hashes: Sequence[str]):
-    if not values:
+    if len(values) == 0:
         return None
+    values = np.asarray(values, dtype=np.float64)
     n = len(values)
-    min_idx = min(range(n), key=lambda i: values[i])
-    max_idx = max(range(n), key=lambda i: values[i])
+    min_idx = int(values.argmin())
+    max_idx = int(values.argmax())
     med_val, med_indices = _median_with_indices(values)
     return {
         "count": n,
-        "min": {"value": values[min_idx], "hash": hashes[min_idx]},
-        "median": {"value": med_val, "hashes": [hashes[i] for i in med_indices]},
-        "max": {"value": values[max_idx], "hash": hashes[max_idx]},
+        "min": {"value": float(values[min_idx]), "hash": str(hashes[min_idx])},
+        "median": {"value": med_val, "hashes": [str(hashes[i]) for i in med_indices]},
+        "max": {"value": float(values[max_idx]), "hash": str(hashes[max_idx])},
     }
 
 # ===== Etherscan fetchers =====
-def _paged_get(params_base: dict, api_url: str, page_size: int, pause_s: float) -> List[dict]:
-    page = 1
-    items: List[dict] = []
+# Etherscan free tier allows 5 req/s. The throttler only delays a request when the last
+# second already used the budget, so slow responses are not followed by a needless sleep.
+ETHERSCAN_RATE_LIMIT = int(os.getenv("ETHERSCAN_RATE_LIMIT", "5"))
+MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", "5"))
+# One semaphore per event loop: asyncio primitives bind to the loop that first waits on them.
+_request_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+_throttler = Throttler(rate_limit=ETHERSCAN_RATE_LIMIT, period=1.0)
+
+def _request_slot() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    slots = _request_slots.get(loop)
+    if slots is None:
+        slots = _request_slots[loop] = asyncio.Semaphore(MAX_CONCURRENCY)
+    return slots
+
+# Pages requested together once a query turns out to span more than one page.
+PREFETCH_PAGES = int(os.getenv("PREFETCH_PAGES", "4"))
+
+async def _get_page(session: aiohttp.ClientSession, params_base: dict, page: int, api_url: str,
+                    page_size: int) -> List[dict]:
+    params = dict(params_base)
+    params.update({"page": page, "offset": page_size})
+    async with _request_slot(), _throttler:
+        async with session.get(api_url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as r:
+            r.raise_for_status()
+            data = orjson.loads(await r.read())
+    status = data.get("status")
+    message = data.get("message")
+    if status == "0" and message != "No transactions found":
+        raise RuntimeError(f"Etherscan error: {message} | result={data.get('result')}")
+    return data.get("result") or []
+
+async def _paged_get(session: aiohttp.ClientSession, params_base: dict, api_url: str, page_size: int) -> List[dict]:
+    # Most addresses fit in one page, so only start speculating once page 1 comes back full.
+    items = await _get_page(session, params_base, 1, api_url, page_size)
+    if len(items) < page_size:
+        return items
+    page = 2
     while True:
-        params = dict(params_base)
-        params.update({"page": page, "offset": page_size})
-        r = requests.get(api_url, params=params, timeout=30)
-        r.raise_for_status()
-        data = r.json()
-        status = data.get("status")
-        message = data.get("message")
-        if status == "0" and message != "No transactions found":
-            raise RuntimeError(f"Etherscan error: {message} | result={data.get('result')}")
-        chunk = data.get("result", [])
-        if not chunk:
-            break
-        items.extend(chunk)
-        if len(chunk) < page_size:
-            break
-        page += 1
-        if pause_s:
-            time.sleep(pause_s)  # be gentle with rate limits
-    return items
-
-def fetch_normal_txs(address: str, api_key: str, api_url: str, startblock=0, endblock=99999999, sort="asc",
-                     page_size: int = PAGE_SIZE, pause_s: float = 0.21) -> List[dict]:
-    return _paged_get({
-        "module": "account", "action": "txlist",
-        "address": address, "startblock": startblock, "endblock": endblock,
-        "sort": sort, "apikey": api_key
-    }, api_url, page_size, pause_s)
+        # Request the next window of pages at once; anything after the first short page is
+        # discarded, including errors from pages past the end of the result set.
+        chunks = await asyncio.gather(
+            *(_get_page(session, params_base, p, api_url, page_size) for p in range(page, page + PREFETCH_PAGES)),
+            return_exceptions=True,
+        )
+        for chunk in chunks:
+            if isinstance(chunk, BaseException):
+                raise chunk
+            items.extend(chunk)
+            if len(chunk) < page_size:
+                return items
+        page += PREFETCH_PAGES
 
-def fetch_internal_txs(address: str, api_key: str, api_url: str, startblock=0, endblock=99999999, sort="asc",
-                       page_size: int = PAGE_SIZE, pause_s: float = 0.21) -> List[dict]:
-    return _paged_get({
-        "module": "account", "action": "txlistinternal",
-        "address": address, "startblock": startblock, "endblock": endblock,
-        "sort": sort, "apikey": api_key
-    }, api_url, page_size, pause_s)
+async def _batched_get(session: aiohttp.ClientSession, params_list: Sequence[dict], api_url: str,
+                       page_size: int) -> List[List[dict]]:
+    """Fetch several Etherscan queries over one pooled session; results come back in input order."""
+    return list(await asyncio.gather(*(_paged_get(session, p, api_url, page_size) for p in params_list)))
 
-def fetch_token_txs(address: str, api_key: str, api_url: str, startblock=0, endblock=99999999, sort="asc",
-                    page_size: int = PAGE_SIZE, pause_s: float = 0.21) -> List[dict]:
-    return _paged_get({
-        "module": "account", "action": "tokentx",
+def _account_params(action: str, address: str, api_key: str, startblock, endblock, sort) -> dict:
+    return {
+        "module": "account", "action": action,
         "address": address, "startblock": startblock, "endblock": endblock,
         "sort": sort, "apikey": api_key
-    }, api_url, page_size, pause_s)
+    }
+
+async def fetch_normal_txs(session: aiohttp.ClientSession, address: str, api_key: str, api_url: str, startblock=0,
+                           endblock=99999999, sort="asc", page_size: int = PAGE_SIZE) -> List[dict]:
+    return await _paged_get(session, _account_params("txlist", address, api_key, startblock, endblock, sort),
+                            api_url, page_size)
+
+async def fetch_internal_txs(session: aiohttp.ClientSession, address: str, api_key: str, api_url: str, startblock=0,
+                             endblock=99999999, sort="asc", page_size: int = PAGE_SIZE) -> List[dict]:
+    return await _paged_get(session, _account_params("txlistinternal", address, api_key, startblock, endblock, sort),
+                            api_url, page_size)
+
+async def fetch_token_txs(session: aiohttp.ClientSession, address: str, api_key: str, api_url: str, startblock=0,
+                          endblock=99999999, sort="asc", page_size: int = PAGE_SIZE) -> List[dict]:
+    return await _paged_get(session, _account_params("tokentx", address, api_key, startblock, endblock, sort),
+                            api_url, page_size)
+
+async def fetch_block_number(session: aiohttp.ClientSession, api_key: str, api_url: str) -> int:
+    params = {"module": "proxy", "action": "eth_blockNumber", "apikey": api_key}
+    async with _request_slot(), _throttler:
+        async with session.get(api_url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as r:
+            r.raise_for_status()
+            data = orjson.loads(await r.read())
+    result = data.get("result")
+    if not isinstance(result, str) or not result.startswith("0x"):
+        raise RuntimeError(f"Etherscan error: {data.get('message')} | result={result}")
+    return int(result, 16)
+
+# ===== Result cache =====
+# Stats for a block range that ends past finality never change, so they are kept until evicted;
+# anything touching the chain tip expires after CACHE_TTL_S.
+CACHE_TTL_S = float(os.getenv("CACHE_TTL_S", "30"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+FINALITY_DEPTH = 64   # blocks behind the tip considered immutable
+BLOCK_TIME_S = 12.0   # how long a fetched tip is trusted before asking again
+
+_stats_cache: "OrderedDict[str, Tuple[Optional[float], Dict]]" = OrderedDict()
+_known_tip = 0
+_known_tip_at = float("-inf")
+
+def _cache_key(*parts) -> str:
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+def _cache_get(key: str) -> Optional[Dict]:
+    entry = _stats_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at is not None and expires_at <= time.monotonic():
+        del _stats_cache[key]
+        return None
+    _stats_cache.move_to_end(key)
+    return value
+
+def _cache_put(key: str, value: Dict, ttl_s: Optional[float]) -> None:
+    _stats_cache[key] = (None if ttl_s is None else time.monotonic() + ttl_s, value)
+    _stats_cache.move_to_end(key)
+    while len(_stats_cache) > CACHE_MAX_ENTRIES:
+        _stats_cache.popitem(last=False)
+
+async def _chain_tip(session: aiohttp.ClientSession, api_key: str, api_url: str) -> int:
+    """Latest block number, asked for at most once per BLOCK_TIME_S; 0 if it was never fetched."""
+    global _known_tip, _known_tip_at
+    if time.monotonic() - _known_tip_at >= BLOCK_TIME_S:
+        try:
+            tip = await fetch_block_number(session, api_key, api_url)
+        except (aiohttp.ClientError, asyncio.TimeoutError, RuntimeError, ValueError):
+            return _known_tip  # unknown tip: callers treat fewer blocks as final
+        _known_tip = max(_known_tip, tip)
+        _known_tip_at = time.monotonic()
+    return _known_tip
+
+async def _is_final(session: aiohttp.ClientSession, endblock: int, api_key: str, api_url: str) -> bool:
+    if endblock < _known_tip - FINALITY_DEPTH:
+        return True
+    return endblock < await _chain_tip(session, api_key, api_url) - FINALITY_DEPTH
+
+async def _sync_and_load(session: aiohttp.ClientSession, address: str, actions: Sequence[str], api_key: str,
+                         startblock: int, endblock: int, sort: Literal["asc", "desc"], api_url: str,
+                         page_size: int) -> Dict[str, List[dict]]:
+    """
+    Bring the local mirror of each endpoint up to date for [startblock, endblock], then read the
+    range back from MySQL. Only blocks not mirrored yet are requested from Etherscan, so repeat
+    queries cost the delta since the last sync (or nothing at all for a past range). Blocks within
+    FINALITY_DEPTH of the tip are never marked as mirrored, so they are refetched every time.
+    """
+    address_lc = address.lower()
+    # Short transactions on either side of the fetch: no pooled connection is held while
+    # waiting on the throttled Etherscan calls.
+    async with SessionLocal() as db:
+        windows = {a: await tx_store.get_window(db, address_lc, a) for a in actions}
+        wanted = [(a, rng) for a in actions for rng in tx_store.missing_ranges(windows[a], startblock, endblock)]
+        if not wanted:
+            return {a: await tx_store.load_txs(db, address_lc, a, startblock, endblock, sort) for a in actions}
+
+    # One batch over the shared keep-alive session: the endpoints reuse its TCP/TLS
+    # connections and their round-trips overlap instead of being chained.
+    results, tip = await asyncio.gather(
+        _batched_get(
+            session,
+            [_account_params(a, address, api_key, lo, hi, "asc") for a, (lo, hi) in wanted],
+            api_url, page_size,
+        ),
+        _chain_tip(session, api_key, api_url),
+    )
+
+    async with SessionLocal() as db:
+        for a in actions:
+            fetched = [(rng, txs) for (b, rng), txs in zip(wanted, results) if b == a]
+            if fetched:
+                await tx_store.save_txs(db, address_lc, a, fetched, tip - FINALITY_DEPTH)
+        await db.commit()
+        return {a: await tx_store.load_txs(db, address_lc, a, startblock, endblock, sort) for a in actions}
+
+@asynccontextmanager
+async def _http_session(http: Optional[aiohttp.ClientSession]) -> AsyncIterator[aiohttp.ClientSession]:
+    if http is not None:
+        yield http
+    else:
+        async with aiohttp.ClientSession() as session:
+            yield session
 
 class ComputeOptions(Tuple):
     """Use a simple dict-like options object instead if you prefer Pydantic in FastAPI."""
     pass
 
-def compute_address_stats(
+async def compute_address_stats(
     address: str,
     *,
     api_key: Optional[str] = None,
@@ -121,45 +298,107 @@ def compute_address_stats(
     include_tokens: bool = False,
     exclude_zero_eth: bool = False,
     unified: bool = False,
+    raw_eth_amounts: bool = False,
     startblock: int = 0,
     endblock: int = 9_9999_999,
     sort: Literal["asc", "desc"] = "asc",
     api_url: str = API_URL,
     page_size: int = PAGE_SIZE,
-    pause_s: float = 0.21,
+    http: Optional[aiohttp.ClientSession] = None,
 ) -> Dict:
     """
-    Returns a JSON-serializable dict with ETH / stablecoin / unified stats.
+    Returns a dict with ETH / stablecoin / unified stats, JSON-serializable unless
+    `raw_eth_amounts` is set: then out["eth"]["raw_eth_amounts"] is an ndarray of per-tx
+    ETH values, meant to be streamed (see app.py) rather than dumped as JSON.
     Does not print or parse CLI args — safe to call from a web handler.
+    Summaries are cached per option set; callers must not mutate the returned dict.
+    Pass a long-lived `http` session to keep Etherscan connections warm across calls.
     """
     api_key = api_key or os.getenv("ETHERSCAN_API_KEY")
     if not api_key:
         raise RuntimeError("ETHERSCAN_API_KEY missing")
 
-    # ---- ETH (normal + optional internal) ----
-    normal = fetch_normal_txs(address, api_key, api_url, startblock, endblock, sort, page_size, pause_s)
-    internal = fetch_internal_txs(address, api_key, api_url, startblock, endblock, sort, page_size, pause_s) if include_internal else []
-
-    eth_vals_eth: List[float] = []
-    eth_vals_eur: List[float] = []
-    eth_hashes: List[str] = []
+    key = _cache_key(address.lower(), startblock, endblock, sort, include_internal, include_tokens,
+                     exclude_zero_eth, unified, api_url)
+    # Raw amounts can be 100k+ floats per address, so they are never cached: a raw request is
+    # rebuilt from the MySQL mirror and only its summary goes into the cache.
+    if not raw_eth_amounts:
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
 
-    for tx in normal:
-        v_eth = wei_to_eth(tx["value"])
-        if exclude_zero_eth and v_eth == 0:
-            continue
-        eth_vals_eth.append(v_eth)
-        eth_vals_eur.append(eth_to_eur(v_eth))
-        eth_hashes.append(tx["hash"])
+    async with _http_session(http) as session:
+        by_action = await _fetch_all(
+            session,
+            address,
+            api_key=api_key,
+            include_internal=include_internal,
+            include_tokens=include_tokens,
+            startblock=startblock,
+            endblock=endblock,
+            sort=sort,
+            api_url=api_url,
+            page_size=page_size,
+        )
+        final = await _is_final(session, endblock, api_key, api_url)
+    # The reduction is CPU-bound; run it off the event loop so other requests keep being served.
+    out = await asyncio.to_thread(
+        _reduce,
+        by_action,
+        include_internal=include_internal,
+        include_tokens=include_tokens,
+        exclude_zero_eth=exclude_zero_eth,
+        unified=unified,
+        raw_eth_amounts=raw_eth_amounts,
+    )
+    _cache_put(key, {k: v for k, v in out.items() if k != "eth"}, None if final else CACHE_TTL_S)
+    return out
 
+async def _fetch_all(
+    session: aiohttp.ClientSession,
+    address: str,
+    *,
+    api_key: str,
+    include_internal: bool = False,
+    include_tokens: bool = False,
+    startblock: int = 0,
+    endblock: int = 9_9999_999,
+    sort: Literal["asc", "desc"] = "asc",
+    api_url: str = API_URL,
+    page_size: int = PAGE_SIZE,
+) -> Dict[str, List[dict]]:
+    """Etherscan items for every requested endpoint, keyed by action."""
+    actions = ["txlist"]
     if include_internal:
-        for tx in internal:
-            v_eth = wei_to_eth(tx["value"])
-            if exclude_zero_eth and v_eth == 0:
-                continue
-            eth_vals_eth.append(v_eth)
-            eth_vals_eur.append(eth_to_eur(v_eth))
-            eth_hashes.append(tx["hash"])
+        actions.append("txlistinternal")
+    if include_tokens:
+        actions.append("tokentx")
+    return await _sync_and_load(session, address, actions, api_key, startblock, endblock, sort, api_url, page_size)
+
+def _reduce(
+    by_action: Dict[str, List[dict]],
+    *,
+    include_internal: bool = False,
+    include_tokens: bool = False,
+    exclude_zero_eth: bool = False,
+    unified: bool = False,
+    raw_eth_amounts: bool = False,
+) -> Dict:
+    """Turn fetched items into the stats dict. Pure CPU work, no I/O."""
+    # ---- ETH (normal + optional internal) ----
+    normal = by_action["txlist"]
+    internal = by_action.get("txlistinternal", [])
+    tokens = by_action.get("tokentx", [])
+
+    eth_txs = normal + internal if include_internal else normal
+    wei = parse_raw_amounts([tx["value"] for tx in eth_txs])
+    eth_hashes = np.array([tx["hash"] for tx in eth_txs], dtype=str)
+    if exclude_zero_eth:
+        mask = wei != 0
+        wei = wei[mask]
+        eth_hashes = eth_hashes[mask]
+    eth_vals_eth = wei * _WEI_TO_ETH
+    eth_vals_eur = wei * _WEI_TO_EUR
 
     out: Dict[str, Dict] = {
         # "params": {
@@ -181,24 +420,25 @@ def compute_address_stats(
         #     "eur_stats": stats_with_hash(eth_vals_eur, eth_hashes),
         # },
     }
+    if raw_eth_amounts:
+        # Left as an ndarray: potentially 100k+ floats, meant to be streamed rather than embedded in JSON
+        out["eth"] = {"raw_eth_amounts": eth_vals_eth}
 
     # ---- Stablecoins (USDC/USDT only) ----
-    token_eur_vals: List[float] = []
-    token_hashes: List[str] = []
+    token_eur_vals = np.empty(0, dtype=np.float64)
+    token_hashes = np.empty(0, dtype=str)
     if include_tokens:
-        tokens = fetch_token_txs(address, api_key, api_url, startblock, endblock, sort, page_size, pause_s)
-        for t in tokens:
-            raw = int(t["value"])
-            if raw == 0:
-                continue
-            contract = t["contractAddress"].lower()
-            if contract not in STABLE_TOKENS:
-                continue
-            decimals = STABLE_TOKENS[contract]
-            amount_usd = to_float_amount(t["value"], decimals)
-            eur_val = usd_to_eur(amount_usd)
-            token_eur_vals.append(eur_val)
-            token_hashes.append(t["hash"])
+        # contractAddress is lowercased when stored (see tx_store), so compare as-is
+        contracts = np.array([t["contractAddress"] for t in tokens], dtype=str)
+        stable_idx = np.flatnonzero(np.isin(contracts, list(_STABLE_DIVISORS)))
+        divisor = np.ones(len(contracts), dtype=np.float64)
+        for contract, contract_divisor in _STABLE_DIVISORS.items():
+            divisor[contracts == contract] = contract_divisor
+        raw = parse_raw_amounts([tokens[i]["value"] for i in stable_idx])
+        keep = raw != 0
+        stable_idx = stable_idx[keep]
+        token_eur_vals = raw[keep] / divisor[stable_idx] * FIXED_USD_EUR_RATE
+        token_hashes = np.array([tokens[i]["hash"] for i in stable_idx], dtype=str)
 
         out["stablecoins"] = {
             "eur_stats": stats_with_hash(token_eur_vals, token_hashes),
@@ -208,14 +448,9 @@ def compute_address_stats(
 
     # ---- Unified EUR view ----
     if unified:
-        unified_vals: List[float] = []
-        unified_hashes: List[str] = []
-        if eth_vals_eur:
-            unified_vals += eth_vals_eur
-            unified_hashes += eth_hashes
-        if token_eur_vals:
-            unified_vals += token_eur_vals
-            unified_hashes += token_hashes
+        # One C-level copy of each source; the median needs both sides in a single array anyway
+        unified_vals = np.concatenate([eth_vals_eur, token_eur_vals])
+        unified_hashes = np.concatenate([eth_hashes, token_hashes])
         out["unified"] = {"eur_stats": stats_with_hash(unified_vals, unified_hashes)}
     else:
         out["unified"] = {"eur_stats": None}
@@ -1,27 +1,33 @@
-import socket
-import threading
+import asyncio
 
 HOST = '127.0.0.1'
 PORT = 8080
 
-server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
-server_socket.bind((HOST, PORT))
-server_socket.listen(5)
-
-print('Server is listening...')
-
-while True:
-    # 3. Accept a client connection
-    client_socket, client_addr = server_socket.accept()
+async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    client_addr = writer.get_extra_info("peername")
     print(f"Connection from {client_addr}")
 
-    # 4. Receive data (up to 1024 bytes)
-    data = client_socket.recv(1024)
+    # 1. Receive data (up to 1024 bytes)
+    data = await reader.read(1024)
     print(f"Received: {data}")
 
-    # 5. Send raw response
-    client_socket.sendall(b"Hello from raw TCP server!\n")
+    # 2. Send raw response
+    writer.write(b"Hello from raw TCP server!\n")
+    await writer.drain()
+
+    # 3. Close connection
+    writer.close()
+    await writer.wait_closed()
+
+
+async def main():
+    # Each connection runs as its own task, so a slow client no longer stalls the others
+    server = await asyncio.start_server(handle_client, HOST, PORT, backlog=5)
+    print('Server is listening...')
+    async with server:
+        await server.serve_forever()
+
 
-    # 6. Close connection
-    client_socket.close()
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(main())
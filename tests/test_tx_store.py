@@ -0,0 +1,57 @@
+from tx_store import missing_ranges, widen_window
+
+LATEST = 99_999_999
+
+
+def sync(window, startblock, endblock, final_block):
+    """One request's worth of bookkeeping: what gets fetched, and the window saved afterwards."""
+    ranges = missing_ranges(window, startblock, endblock)
+    return ranges, (widen_window(window, ranges, final_block) if ranges else window)
+
+
+def test_missing_ranges_without_window_fetches_request():
+    assert missing_ranges(None, 0, LATEST) == [(0, LATEST)]
+    assert missing_ranges((0, -1), 50, 60) == [(50, 60)]
+
+
+def test_missing_ranges_around_window():
+    assert missing_ranges((100, 200), 120, 180) == []
+    assert missing_ranges((100, 200), 0, 300) == [(0, 99), (201, 300)]
+    # gaps up to the window are included so the result can be merged into it
+    assert missing_ranges((100, 200), 0, 50) == [(0, 99)]
+    assert missing_ranges((100, 200), 500, 600) == [(201, 600)]
+
+
+def test_widen_window_stops_at_final_block():
+    assert widen_window(None, [(0, LATEST)], 936) == (0, 936)
+    assert widen_window((0, 900), [(901, LATEST)], 936) == (0, 936)
+
+
+def test_widen_window_ignores_ranges_above_final_block():
+    assert widen_window(None, [(990, LATEST)], 936) == (0, -1)
+    assert widen_window((0, 900), [(990, LATEST)], 936) == (0, 900)
+
+
+def test_widen_window_keeps_disjoint_ranges_out():
+    assert widen_window((100, 200), [(500, 600)], 936) == (100, 200)
+
+
+def test_widen_window_merges_backfill_and_forward_ranges():
+    assert widen_window((100, 200), [(0, 99), (201, LATEST)], 936) == (0, 936)
+
+
+def test_widen_window_clamps_to_final_block():
+    # an unknown tip (final_block from a stale or zero tip) must never leave a window past it
+    assert widen_window((0, 900), [(901, 950)], 800) == (0, 800)
+    assert widen_window((0, 900), [(901, 950)], -64) == (0, -1)
+
+
+def test_non_final_blocks_are_refetched_after_mixed_queries():
+    window = None
+    ranges, window = sync(window, 990, LATEST, final_block=936)
+    assert window == (0, -1)
+    ranges, window = sync(window, 0, 995, final_block=936)
+    assert ranges == [(0, 995)]
+    assert window == (0, 936)
+    ranges, window = sync(window, 0, 995, final_block=936)
+    assert ranges == [(937, 995)]
@@ -0,0 +1,141 @@
+# tx_store.py
+from typing import List, Literal, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db import NormalTx, InternalTx, TokenTx, TxSync
+
+# Etherscan action -> table mirroring its results
+TX_MODELS = {
+    "txlist": NormalTx,
+    "txlistinternal": InternalTx,
+    "tokentx": TokenTx,
+}
+
+# ===== Row conversion =====
+def _to_row(action: str, address: str, tx: dict) -> dict:
+    row = {
+        "address": address,
+        "hash": tx["hash"],
+        "block_number": int(tx["blockNumber"]),
+        "value": tx["value"],
+    }
+    if action == "txlistinternal":
+        row["trace_id"] = tx.get("traceId", "")
+    elif action == "tokentx":
+        row["log_index"] = int(tx["logIndex"])
+        row["contract_address"] = tx["contractAddress"].lower()
+    return row
+
+# ===== Sync bookkeeping =====
+# A window is the (from_block, to_block) pair stored in tx_sync: every block in it is final and
+# fully mirrored. to_block < from_block means nothing is mirrored yet.
+Window = Tuple[int, int]
+
+async def get_window(session: AsyncSession, address: str, action: str) -> Optional[Window]:
+    row = (await session.execute(
+        select(TxSync.from_block, TxSync.to_block).where(TxSync.address == address, TxSync.action == action)
+    )).first()
+    return None if row is None else (row.from_block, row.to_block)
+
+def missing_ranges(window: Optional[Window], startblock: int, endblock: int) -> List[Tuple[int, int]]:
+    """Block ranges that must be fetched so [startblock, endblock] is fully mirrored."""
+    if window is None or window[1] < window[0]:
+        return [(startblock, endblock)]
+    from_block, to_block = window
+    ranges: List[Tuple[int, int]] = []
+    # Ranges run up to / start right after the window, even past the request, so the
+    # result stays contiguous with it and can be merged in.
+    if startblock < from_block:
+        ranges.append((startblock, from_block - 1))
+    if endblock > to_block:
+        ranges.append((to_block + 1, endblock))
+    return ranges
+
+def widen_window(window: Optional[Window], fetched_ranges: Sequence[Tuple[int, int]],
+                 final_block: int) -> Window:
+    """
+    The synced window after `fetched_ranges` were fully refetched. Only the final part of each
+    range, [lo, min(hi, final_block)], can join the window, and only if it touches it; a range
+    starting above `final_block` changes nothing.
+    """
+    from_block, to_block = window if window is not None else (0, -1)
+    for lo, hi in sorted(fetched_ranges):
+        top = min(hi, final_block)
+        if lo > top:
+            continue
+        if to_block < from_block:
+            from_block, to_block = lo, top
+        elif lo <= to_block + 1 and top >= from_block - 1:
+            from_block, to_block = min(from_block, lo), max(to_block, top)
+    to_block = min(to_block, final_block)
+    if to_block < from_block:
+        return 0, -1
+    return from_block, to_block
+
+async def _lock_window(session: AsyncSession, address: str, action: str) -> Window:
+    """
+    Row-lock the tx_sync entry for the rest of the transaction, creating it first if needed, so
+    concurrent syncs of one address/endpoint write one after another instead of colliding.
+    """
+    stmt = insert(TxSync).values(address=address, action=action, from_block=0, to_block=-1)
+    await session.execute(stmt.on_duplicate_key_update(action=stmt.inserted.action))
+    row = (await session.execute(
+        select(TxSync.from_block, TxSync.to_block)
+        .where(TxSync.address == address, TxSync.action == action)
+        .with_for_update()
+    )).one()
+    return row.from_block, row.to_block
+
+async def save_txs(session: AsyncSession, address: str, action: str,
+                   fetched: Sequence[Tuple[Tuple[int, int], List[dict]]], final_block: int) -> None:
+    """
+    Replace the stored items of each fetched range and widen the synced window. The upper bound
+    never passes `final_block`, so blocks that may still be reorged are refetched on the next sync
+    and any orphaned rows in them are dropped.
+    """
+    window = await _lock_window(session, address, action)
+    model = TX_MODELS[action]
+    for (lo, hi), _ in fetched:
+        await session.execute(
+            delete(model).where(model.address == address, model.block_number.between(lo, hi))
+        )
+    rows = [_to_row(action, address, tx) for _, txs in fetched for tx in txs]
+    if rows:
+        stmt = insert(model)
+        stmt = stmt.on_duplicate_key_update(block_number=stmt.inserted.block_number, value=stmt.inserted.value)
+        await session.execute(stmt, rows)
+
+    from_block, to_block = widen_window(window, [rng for rng, _ in fetched], final_block)
+    await session.execute(
+        update(TxSync)
+        .where(TxSync.address == address, TxSync.action == action)
+        .values(from_block=from_block, to_block=to_block)
+    )
+
+async def load_txs(session: AsyncSession, address: str, action: str, startblock: int, endblock: int,
+                   sort: Literal["asc", "desc"] = "asc") -> List[dict]:
+    """
+    Stored items for [startblock, endblock] in the subset of the Etherscan item shape that the
+    stats code reads (blockNumber stays an int). Only those columns are selected, skipping ORM
+    entity construction. Rows in
+    the same block are ordered by a per-table tie-breaker, so repeated queries list them identically.
+    """
+    model = TX_MODELS[action]
+    keys = [model.block_number, model.log_index if action == "tokentx" else model.hash]
+    if action == "txlistinternal":
+        keys.append(model.trace_id)
+    columns = [model.hash, model.value, model.block_number]
+    if action == "tokentx":
+        columns.append(model.contract_address)
+    stmt = (
+        select(*columns)
+        .where(model.address == address, model.block_number.between(startblock, endblock))
+        .order_by(*(k.asc() if sort == "asc" else k.desc() for k in keys))
+    )
+    rows = (await session.execute(stmt)).all()
+    if action == "tokentx":
+        return [{"hash": h, "value": v, "blockNumber": b, "contractAddress": c} for h, v, b, c in rows]
+    return [{"hash": h, "value": v, "blockNumber": b} for h, v, b in rows]